@@ -26,6 +26,10 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+class TaskNotFoundError(ValueError):
+    """Raised when a task id cannot be resolved through the client"""
+
+
 class TickTickAdapter:
     """TickTick client adapter based on ticktick.py library"""
 
@@ -291,7 +295,7 @@ class TickTickAdapter:
 
         if not task:
             msg = f"Task {task_id} not found"
-            raise ValueError(msg)
+            raise TaskNotFoundError(msg)
 
         # Ensure projectId is set (inbox tasks may have 'inbox' instead of actual ID)
         if task.get('projectId') == 'inbox' or not task.get('projectId'):
@@ -335,7 +339,7 @@ class TickTickAdapter:
 
         if not task:
             msg = f"Task {task_id} not found"
-            raise ValueError(msg)
+            raise TaskNotFoundError(msg)
 
         # Update basic fields
         if title:
@@ -479,7 +483,7 @@ class TickTickAdapter:
 
         if not task:
             msg = f"Task {task_id} not found"
-            raise ValueError(msg)
+            raise TaskNotFoundError(msg)
 
         # Ensure projectId is set (inbox tasks may have 'inbox' instead of actual ID)
         if task.get('projectId') == 'inbox' or not task.get('projectId'):
@@ -3,7 +3,7 @@ Timezone conversion utilities for TickTick MCP tools
 """
 
 import logging
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import pytz
@@ -13,6 +13,19 @@ logger = logging.getLogger(__name__)
 # TickTick status constants
 COMPLETED_STATUS = 2
 
+# Shared UTC tzinfo for every zero-offset parse and "now" lookup
+UTC = timezone.utc
+# Timezone names whose wall time equals UTC wall time
+UTC_TIMEZONE_NAMES = frozenset(("UTC", "Etc/UTC"))
+# Length of a date-only "YYYY-MM-DD" ISO string
+DATE_LENGTH = 10
+ZERO_OFFSET = timedelta(0)
+
+
+def _strip_tz(dt: datetime) -> str:
+    """Format the wall-clock time of a parsed datetime as YYYY-MM-DDTHH:MM:SS"""
+    return dt.replace(tzinfo=None).isoformat(timespec="seconds")
+
 
 def convert_utc_to_local_time(utc_time_str: str, timezone_str: str) -> str:
     """
@@ -35,15 +48,20 @@ def convert_utc_to_local_time(utc_time_str: str, timezone_str: str) -> str:
         # Parse the datetime
         utc_dt = datetime.fromisoformat(utc_time_str)
 
-        # Get timezone
-        if timezone_str and timezone_str.strip():
-            tz = pytz.timezone(timezone_str)
-            # Convert to local time
-            local_dt = utc_dt.astimezone(tz)
-            # Format as local time string (without timezone info for user-friendly display)
-            return local_dt.strftime("%Y-%m-%dT%H:%M:%S")
         # If no timezone info, return UTC time as is
-        return utc_dt.strftime("%Y-%m-%dT%H:%M:%S")
+        if not (timezone_str and timezone_str.strip()):
+            return _strip_tz(utc_dt)
+
+        # UTC target and UTC input: astimezone would be a no-op
+        if timezone_str in UTC_TIMEZONE_NAMES and utc_dt.utcoffset() == ZERO_OFFSET:
+            return _strip_tz(utc_dt)
+
+        # Get timezone
+        tz = pytz.timezone(timezone_str)
+        # Convert to local time
+        local_dt = utc_dt.astimezone(tz)
+        # Format as local time string (without timezone info for user-friendly display)
+        return local_dt.strftime("%Y-%m-%dT%H:%M:%S")
 
     except (ValueError, TypeError, pytz.UnknownTimeZoneError) as e:
         logger.debug(
@@ -59,11 +77,13 @@ def convert_task_times_to_local(task: dict[str, Any]) -> dict[str, Any]:
     """
     Convert all time fields in a task from UTC to local time
 
+    The task is mutated in place (no copy is made) and returned for chaining.
+
     Args:
         task: Task dictionary containing time fields and timezone info
 
     Returns:
-        Task dictionary with converted local times
+        The same task dictionary, with converted local times
     """
     try:
         # Get timezone from task
@@ -102,17 +122,16 @@ def convert_tasks_times_to_local(tasks: list) -> list:
     """
     Convert all time fields in a list of tasks from UTC to local time
 
+    Each task dictionary is mutated in place; callers own the list.
+
     Args:
         tasks: List of task dictionaries
 
     Returns:
-        List of task dictionaries with converted local times
+        List of the same task dictionaries with converted local times
     """
     try:
-        converted_tasks = []
-        for task in tasks:
-            converted_task = convert_task_times_to_local(task)
-            converted_tasks.append(converted_task)
+        converted_tasks = [convert_task_times_to_local(task) for task in tasks]
     except (ValueError, TypeError) as e:
         logger.debug("Failed to convert tasks times: %s", e)
         return tasks
@@ -135,13 +154,28 @@ def get_user_today(user_timezone: str) -> date:
             tz = pytz.timezone(user_timezone)
             return datetime.now(tz).date()
         # Fallback to UTC if no timezone info
-        return datetime.now(timezone.utc).date()
+        return datetime.now(UTC).date()
     except pytz.UnknownTimeZoneError as e:
         logger.debug(
             "Failed to get user today with timezone %s: %s", user_timezone, e,
         )
         # Fallback to UTC
-        return datetime.now(timezone.utc).date()
+        return datetime.now(UTC).date()
+
+
+def _parse_naive_as_utc(stamp: str) -> datetime:
+    """
+    Parse the part of a UTC-suffixed time string before the suffix as UTC
+
+    Raises ValueError when that part is date-only or already carries an
+    offset, so strings like "2025-08-01Z" or "...+08:00Z" are rejected rather
+    than silently read as UTC.
+    """
+    dt = datetime.fromisoformat(stamp)
+    if dt.tzinfo is not None or len(stamp) <= DATE_LENGTH:
+        msg = f"Invalid UTC time string: {stamp!r}"
+        raise ValueError(msg)
+    return dt.replace(tzinfo=UTC)
 
 
 def parse_task_date(date_str: str) -> datetime | None:
@@ -158,11 +192,12 @@ def parse_task_date(date_str: str) -> datetime | None:
         return None
 
     try:
-        # Handle different date formats from TickTick
+        # Handle different date formats from TickTick; UTC suffixes are
+        # stripped and the shared UTC tzinfo attached directly
         if date_str.endswith("Z"):
-            date_str = date_str.replace("Z", "+00:00")
-        elif date_str.endswith("+0000"):
-            date_str = date_str.replace("+0000", "+00:00")
+            return _parse_naive_as_utc(date_str[:-1])
+        if date_str.endswith("+0000"):
+            return _parse_naive_as_utc(date_str[:-5])
 
         return datetime.fromisoformat(date_str)
     except ValueError as e:
@@ -191,20 +226,20 @@ def is_task_due_today(task: dict[str, Any], user_timezone: str) -> bool:
         if not task_datetime:
             return False
 
-        # Get user's today
-        user_today = get_user_today(user_timezone)
+        # Get user's today as an ordinal so the comparison is a plain int compare
+        today_ord = get_user_today(user_timezone).toordinal()
 
         # Convert task date to user timezone for comparison
         if user_timezone and user_timezone.strip():
             try:
                 tz = pytz.timezone(user_timezone)
-                task_local_date = task_datetime.astimezone(tz).date()
+                due_ord = task_datetime.astimezone(tz).date().toordinal()
             except (pytz.UnknownTimeZoneError, ValueError):
                 # If timezone conversion fails, use UTC
-                task_local_date = task_datetime.date()
+                due_ord = task_datetime.date().toordinal()
         else:
-            task_local_date = task_datetime.date()
-        is_due_today = task_local_date == user_today
+            due_ord = task_datetime.date().toordinal()
+        is_due_today = due_ord == today_ord
     except (ValueError, TypeError) as e:
         logger.debug("Failed to check if task is due today: %s", e)
         return False
@@ -237,20 +272,20 @@ def is_task_overdue(task: dict[str, Any], user_timezone: str) -> bool:
         if not task_datetime:
             return False
 
-        # Get user's today
-        user_today = get_user_today(user_timezone)
+        # Get user's today as an ordinal so the comparison is a plain int compare
+        today_ord = get_user_today(user_timezone).toordinal()
 
         # Convert task date to user timezone for comparison
         if user_timezone and user_timezone.strip():
             try:
                 tz = pytz.timezone(user_timezone)
-                task_local_date = task_datetime.astimezone(tz).date()
+                due_ord = task_datetime.astimezone(tz).date().toordinal()
             except (pytz.UnknownTimeZoneError, ValueError):
                 # If timezone conversion fails, use UTC
-                task_local_date = task_datetime.date()
+                due_ord = task_datetime.date().toordinal()
         else:
-            task_local_date = task_datetime.date()
-        is_overdue = task_local_date < user_today
+            due_ord = task_datetime.date().toordinal()
+        is_overdue = due_ord < today_ord
     except (ValueError, TypeError) as e:
         logger.debug("Failed to check if task is overdue: %s", e)
         return False
@@ -5,15 +5,13 @@ Set up test environment and shared fixtures
 """
 
 import asyncio
-import sys
-from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-# Ensure project root is on Python path so `src` package can be imported
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# Import modules needed for tests
+# `src` and the project root are put on sys.path by `pythonpath` in pyproject.toml.
+# The adapter comes from the bare `adapters` package, the module its tests patch.
+from adapters.client import TickTickAdapter
 from src.auth import TickTickAuth
 from src.tools import projects, tasks
 from src.tools.auth import AuthTools
@@ -33,12 +31,30 @@ def auth_instance():
     return TickTickAuth()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_tools():
-    """Authentication tools fixture"""
+    """Authentication tools fixture (stateless, shared across the session)"""
     return AuthTools()
 
 
+@pytest.fixture(scope="session")
+def auth_tool_list(auth_tools):
+    """Auth tool descriptors, built once per session (immutable metadata)"""
+    return list(auth_tools.get_tools())
+
+
+@pytest.fixture(scope="module")
+def adapter():
+    """TickTickAdapter shared across a test module, built with auth mocked out
+
+    With TickTickAuth mocked the constructor touches neither the filesystem nor
+    the network, so xdist workers can each build their own copy safely.
+    """
+    with patch("adapters.client.TickTickAuth") as mock_auth_class:
+        mock_auth_class.return_value.is_authenticated.return_value = False
+        yield TickTickAdapter()
+
+
 @pytest.fixture
 def test_credentials():
     """Test credentials fixture"""
@@ -93,10 +109,22 @@ def task_tools():
 # Test markers
 def pytest_configure(config):
     """Configure test markers"""
-    config.addinivalue_line("markers", "unit: Unit test marker")
+    config.addinivalue_line("markers", "unit: Fast unit test marker (no network or real credentials)")
     config.addinivalue_line("markers", "integration: Integration test marker")
     config.addinivalue_line("markers", "e2e: End-to-end test marker")
     config.addinivalue_line("markers", "slow: Slow test marker")
     config.addinivalue_line("markers", "auth: Authentication-related test marker")
     config.addinivalue_line("markers", "mcp: MCP-related test marker")
     config.addinivalue_line("markers", "performance: Performance test marker")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip async tests when pytest-asyncio (the `integration` extra) is missing"""
+    if config.pluginmanager.hasplugin("asyncio"):
+        return
+    skip_async = pytest.mark.skip(
+        reason="pytest-asyncio not installed (pip install -e '.[integration]')",
+    )
+    for item in items:
+        if item.get_closest_marker("asyncio"):
+            item.add_marker(skip_async)
@@ -4,7 +4,6 @@ Real-world end-to-end scenario tests
 """
 
 import asyncio
-import sys
 import time
 import traceback
 from pathlib import Path
@@ -13,8 +12,8 @@ import pytest
 from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+pytestmark = pytest.mark.xdist_group("auth")
 
 
 @pytest.mark.e2e
@@ -601,7 +600,3 @@ class TestLongRunningScenarios:
             "total_tasks": len(all_tasks.get("content", [])),
             "total_projects": len(projects.get("content", [])),
         }
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-m", "e2e"])
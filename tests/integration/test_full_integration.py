@@ -5,7 +5,6 @@ Full integration tests - testing complete workflows
 
 import asyncio
 import contextlib
-import sys
 import time
 import traceback
 from pathlib import Path
@@ -19,8 +18,8 @@ try:
 except ImportError:
     psutil = None  # type: ignore[assignment]
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+pytestmark = pytest.mark.xdist_group("auth")
 
 
 @pytest.mark.integration
@@ -441,7 +440,3 @@ class TestLongRunningIntegration:
 
         except Exception:
             return False
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-m", "integration"])
@@ -11,6 +11,9 @@ from mcp.client.session import ClientSession
 from mcp.client.stdio import StdioServerParameters, stdio_client
 
 
+pytestmark = pytest.mark.xdist_group("auth")
+
+
 @pytest.mark.integration
 @pytest.mark.mcp
 class TestMCPServerModern:
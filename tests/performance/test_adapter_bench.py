@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Adapter hot-path benchmarks
+
+Disabled by default (--benchmark-disable in pyproject.toml), in which case each
+benchmark runs its target once as a smoke test. Run them for real with:
+
+    pytest tests/performance/test_adapter_bench.py -n 0 --benchmark-enable --benchmark-only
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+PRIORITIES = (0, 1, 3, 5)
+SIZES = [pytest.param(1_000, id="1k"), pytest.param(10_000, id="10k")]
+
+
+def _make_tasks(count):
+    """Synthetic task list: every third task completed, priorities cycled"""
+    return [
+        {
+            "id": f"task{i}",
+            "title": f"Task {i} {'report' if i % 10 == 0 else 'chore'}",
+            "content": f"Body of task {i}",
+            "status": 2 if i % 3 == 0 else 0,
+            "priority": PRIORITIES[i % len(PRIORITIES)],
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(params=SIZES)
+def bound_adapter(request, adapter, monkeypatch):
+    """Adapter whose client state holds a synthetic task list of the given size"""
+    client = SimpleNamespace(state={"tasks": _make_tasks(request.param)})
+    monkeypatch.setattr(adapter, "_ensure_client", lambda: client)
+    return adapter
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="get_tasks")
+def test_get_tasks_filtered(benchmark, bound_adapter):
+    """Benchmark get_tasks dropping completed tasks"""
+    result = benchmark(bound_adapter.get_tasks, include_completed=False)
+    assert all(task["status"] != 2 for task in result)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="get_tasks_by_priority")
+def test_get_tasks_by_priority(benchmark, bound_adapter):
+    """Benchmark get_tasks_by_priority"""
+    result = benchmark(bound_adapter.get_tasks_by_priority, 5)
+    assert all(task["priority"] == 5 for task in result)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="search_tasks")
+def test_search_tasks(benchmark, bound_adapter):
+    """Benchmark search_tasks over titles and content"""
+    result = benchmark(bound_adapter.search_tasks, "report")
+    assert result
@@ -6,7 +6,6 @@ Performance tests for TickTick MCP server
 import asyncio
 import gc
 import statistics
-import sys
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -20,11 +19,12 @@ try:
 except ImportError:
     psutil = None  # type: ignore[assignment]
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from tools import projects, tasks
 
 
+pytestmark = pytest.mark.xdist_group("auth")
+
+
 @pytest.mark.performance
 class TestPerformanceBenchmarks:
     """Performance benchmark tests"""
@@ -414,7 +414,3 @@ class TestPerformanceRegression:
             ), f"{operation} baseline too slow: {baseline_time*1000:.3f}ms"
 
         return baselines
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v", "-m", "performance"])
@@ -11,6 +11,9 @@ from unittest.mock import patch
 import pytest
 from dotenv import load_dotenv
 
+# Async fixtures and tests need the `integration` extra; skip the module without it
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
@@ -45,6 +48,9 @@ except ImportError:
     sys.exit(1)
 
 
+pytestmark = pytest.mark.xdist_group("auth")
+
+
 class TestConfig:
     """Test configuration and environment variable management"""
 
@@ -162,7 +168,7 @@ class TestAuthenticationTools:
 class TestProjectManagementTools:
     """Test project management tools"""
 
-    @pytest.fixture(autouse=True)
+    @pytest_asyncio.fixture(autouse=True)
     async def ensure_auth(self):
         """Ensure authentication before each test"""
         username = os.getenv("TICKTICK_USERNAME")
@@ -201,7 +207,7 @@ class TestProjectManagementTools:
 class TestTaskManagementTools:
     """Test task management tools"""
 
-    @pytest.fixture(autouse=True)
+    @pytest_asyncio.fixture(autouse=True)
     async def ensure_auth(self):
         """Ensure authentication before each test"""
         username = os.getenv("TICKTICK_USERNAME")
@@ -372,7 +378,7 @@ class TestMCPParameterHandling:
 class TestMCPRealWorldScenarios:
     """Test real-world MCP usage scenarios"""
 
-    @pytest.fixture(autouse=True)
+    @pytest_asyncio.fixture(autouse=True)
     async def ensure_auth(self):
         """Ensure authentication before each test"""
         username = os.getenv("TICKTICK_USERNAME")
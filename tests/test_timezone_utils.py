@@ -2,7 +2,9 @@
 Tests for timezone conversion utilities
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
 
 from src.utils.timezone_utils import (
     convert_task_times_to_local,
@@ -15,51 +17,57 @@ from src.utils.timezone_utils import (
 )
 
 
+@pytest.mark.unit
 class TestTimezoneUtils:
     """Test timezone conversion utilities"""
 
-    def test_convert_utc_to_local_time_shanghai(self):
-        """Test UTC to Shanghai time conversion"""
-        utc_time = "2025-08-01T16:00:00.000+0000"
-        timezone = "Asia/Shanghai"
-
-        result = convert_utc_to_local_time(utc_time, timezone)
-
-        # Shanghai is UTC+8, so 16:00 UTC = 00:00 next day Shanghai
-        expected = "2025-08-02T00:00:00"
-        assert result == expected
-
-    def test_convert_utc_to_local_time_los_angeles(self):
-        """Test UTC to Los Angeles time conversion"""
-        utc_time = "2025-08-01T16:00:00.000+0000"
-        timezone = "America/Los_Angeles"
-
-        result = convert_utc_to_local_time(utc_time, timezone)
-
-        # Los Angeles is UTC-7 in summer (PDT), so 16:00 UTC = 09:00 same day LA
-        expected = "2025-08-01T09:00:00"
-        assert result == expected
-
-    def test_convert_utc_to_local_time_no_timezone(self):
-        """Test UTC conversion when no timezone provided"""
-        utc_time = "2025-08-01T16:00:00.000+0000"
-        timezone = ""
-
-        result = convert_utc_to_local_time(utc_time, timezone)
-
-        # Should return UTC time as is
-        expected = "2025-08-01T16:00:00"
-        assert result == expected
-
-    def test_convert_utc_to_local_time_z_format(self):
-        """Test UTC conversion with Z format"""
-        utc_time = "2025-08-01T16:00:00.000Z"
-        timezone = "Asia/Shanghai"
-
-        result = convert_utc_to_local_time(utc_time, timezone)
-
-        expected = "2025-08-02T00:00:00"
-        assert result == expected
+    # Shared input and expected strings
+    UTC_1600 = "2025-08-01T16:00:00.000+0000"
+    UTC_LOCAL_1600 = "2025-08-01T16:00:00"
+    SH_0000 = "2025-08-02T00:00:00"
+    LA_0900 = "2025-08-01T09:00:00"
+
+    @pytest.mark.parametrize(
+        ("utc_time", "user_timezone", "expected"),
+        [
+            # Shanghai is UTC+8, so 16:00 UTC = 00:00 next day Shanghai
+            pytest.param(UTC_1600, "Asia/Shanghai", SH_0000, id="shanghai"),
+            # Los Angeles is UTC-7 in summer (PDT), so 16:00 UTC = 09:00 same day LA
+            pytest.param(UTC_1600, "America/Los_Angeles", LA_0900, id="los_angeles"),
+            # Should return UTC time as is when no timezone provided
+            pytest.param(UTC_1600, "", UTC_LOCAL_1600, id="no_timezone"),
+            pytest.param(UTC_1600, "UTC", UTC_LOCAL_1600, id="utc_timezone"),
+            pytest.param(
+                "2025-08-01T16:00:00Z", "Etc/UTC", UTC_LOCAL_1600, id="etc_utc_timezone",
+            ),
+            # Non-UTC input offsets must still be converted to a UTC target
+            pytest.param(
+                "2025-08-01T16:00:00+08:00", "UTC", "2025-08-01T08:00:00", id="utc_timezone_offset_input",
+            ),
+            pytest.param("2025-08-01T16:00:00.000Z", "Asia/Shanghai", SH_0000, id="z_format"),
+            # A space separator is valid ISO input but the output always uses "T"
+            pytest.param("2025-08-01 16:00:00", "", UTC_LOCAL_1600, id="space_separator"),
+            pytest.param(
+                "2025-08-01 16:00:00+00:00", "UTC", UTC_LOCAL_1600, id="space_separator_utc",
+            ),
+            pytest.param("2025-08-01T16:00+00:00", "UTC", UTC_LOCAL_1600, id="no_seconds"),
+            pytest.param("2025-08-01T16Z", "", UTC_LOCAL_1600, id="hour_only"),
+            pytest.param("2025-08-01T16Z", "UTC", UTC_LOCAL_1600, id="hour_only_utc"),
+            pytest.param("2025-08-01T16Z", "Etc/UTC", UTC_LOCAL_1600, id="hour_only_etc_utc"),
+            pytest.param("2025-W31-5T16:00:00", "", UTC_LOCAL_1600, id="week_date"),
+            # Should return original time string on error (with normalized format)
+            pytest.param(
+                UTC_1600, "Invalid/Timezone", "2025-08-01T16:00:00.000+00:00", id="invalid_timezone",
+            ),
+            # Should return original time string on error
+            pytest.param(
+                "invalid-time-format", "Asia/Shanghai", "invalid-time-format", id="invalid_time_format",
+            ),
+        ],
+    )
+    def test_convert_utc_to_local_time(self, utc_time, user_timezone, expected):
+        """Test UTC to local time conversion across timezones and formats"""
+        assert convert_utc_to_local_time(utc_time, user_timezone) == expected
 
     def test_convert_task_times_to_local(self):
         """Test converting task times to local time"""
@@ -67,20 +75,22 @@ class TestTimezoneUtils:
             "id": "test123",
             "title": "Test Task",
             "timeZone": "Asia/Shanghai",
-            "startDate": "2025-08-01T16:00:00.000+0000",
-            "dueDate": "2025-08-01T16:00:00.000+0000",
-            "modifiedTime": "2025-08-01T16:00:00.000+0000",
-            "createdTime": "2025-08-01T16:00:00.000+0000",
+            "startDate": self.UTC_1600,
+            "dueDate": self.UTC_1600,
+            "modifiedTime": self.UTC_1600,
+            "createdTime": self.UTC_1600,
         }
 
         result = convert_task_times_to_local(task)
 
         # All times should be converted to Shanghai time (UTC+8)
-        assert result["startDate"] == "2025-08-02T00:00:00"
-        assert result["dueDate"] == "2025-08-02T00:00:00"
-        assert result["modifiedTime"] == "2025-08-02T00:00:00"
-        assert result["createdTime"] == "2025-08-02T00:00:00"
+        assert result["startDate"] == self.SH_0000
+        assert result["dueDate"] == self.SH_0000
+        assert result["modifiedTime"] == self.SH_0000
+        assert result["createdTime"] == self.SH_0000
         assert result["timeZone"] == "Asia/Shanghai"
+        # Conversion happens in place, no copy is made
+        assert result is task
 
     def test_convert_tasks_times_to_local(self):
         """Test converting multiple tasks times to local time"""
@@ -89,22 +99,22 @@ class TestTimezoneUtils:
                 "id": "test1",
                 "title": "Task 1",
                 "timeZone": "Asia/Shanghai",
-                "dueDate": "2025-08-01T16:00:00.000+0000",
+                "dueDate": self.UTC_1600,
             },
             {
                 "id": "test2",
                 "title": "Task 2",
                 "timeZone": "America/Los_Angeles",
-                "dueDate": "2025-08-01T16:00:00.000+0000",
+                "dueDate": self.UTC_1600,
             },
         ]
 
         result = convert_tasks_times_to_local(tasks)
 
         # First task should be Shanghai time (UTC+8)
-        assert result[0]["dueDate"] == "2025-08-02T00:00:00"
+        assert result[0]["dueDate"] == self.SH_0000
         # Second task should be Los Angeles time (UTC-7 in summer)
-        assert result[1]["dueDate"] == "2025-08-01T09:00:00"
+        assert result[1]["dueDate"] == self.LA_0900
 
     def test_convert_task_times_to_local_no_timezone(self):
         """Test converting task times when no timezone info"""
@@ -112,34 +122,16 @@ class TestTimezoneUtils:
             "id": "test123",
             "title": "Test Task",
             "timeZone": "",
-            "dueDate": "2025-08-01T16:00:00.000+0000",
+            "dueDate": self.UTC_1600,
         }
 
         result = convert_task_times_to_local(task)
 
         # Should return UTC time as is when no timezone
-        assert result["dueDate"] == "2025-08-01T16:00:00"
-
-    def test_convert_utc_to_local_time_invalid_timezone(self):
-        """Test handling of invalid timezone"""
-        utc_time = "2025-08-01T16:00:00.000+0000"
-        timezone = "Invalid/Timezone"
-
-        # Should return original time string on error (with normalized format)
-        result = convert_utc_to_local_time(utc_time, timezone)
-        expected = "2025-08-01T16:00:00.000+00:00"  # Normalized format
-        assert result == expected
-
-    def test_convert_utc_to_local_time_invalid_time_format(self):
-        """Test handling of invalid time format"""
-        utc_time = "invalid-time-format"
-        timezone = "Asia/Shanghai"
-
-        # Should return original time string on error
-        result = convert_utc_to_local_time(utc_time, timezone)
-        assert result == utc_time
+        assert result["dueDate"] == self.UTC_LOCAL_1600
 
 
+@pytest.mark.unit
 class TestTimezoneAwareDateComparison:
     """Test timezone-aware date comparison functions"""
 
@@ -183,11 +175,21 @@ class TestTimezoneAwareDateComparison:
             assert result.month == expected_dt.month
             assert result.day == expected_dt.day
             assert result.hour == expected_dt.hour
-
-    def test_parse_task_date_invalid_format(self):
-        """Test parsing invalid date format"""
-        result = parse_task_date("invalid-date-format")
-        assert result is None
+            assert result.tzinfo is timezone.utc
+
+    @pytest.mark.parametrize(
+        "date_str",
+        [
+            pytest.param("invalid-date-format", id="garbage"),
+            # A UTC suffix must not override an offset already in the string
+            pytest.param("2025-08-01T16:00:00+08:00Z", id="offset_then_z"),
+            pytest.param("2025-08-01T16:00:00+08:00+0000", id="offset_then_plus0000"),
+            pytest.param("2025-08-01Z", id="date_only_z"),
+        ],
+    )
+    def test_parse_task_date_invalid_format(self, date_str):
+        """Test parsing invalid date formats"""
+        assert parse_task_date(date_str) is None
 
     def test_parse_task_date_empty_string(self):
         """Test parsing empty date string"""
@@ -202,7 +204,7 @@ class TestTimezoneAwareDateComparison:
     def test_is_task_due_today_same_timezone(self):
         """Test task due today check in same timezone"""
         # Create a task due today in UTC
-        utc_now = datetime.utcnow()
+        utc_now = datetime.now(timezone.utc)
         task = {
             "dueDate": utc_now.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
             "timeZone": "UTC",
@@ -215,7 +217,7 @@ class TestTimezoneAwareDateComparison:
     def test_is_task_due_today_different_timezone(self):
         """Test task due today check across timezones"""
         # Create a task due at midnight UTC (start of day)
-        utc_midnight = datetime.utcnow().replace(
+        utc_midnight = datetime.now(timezone.utc).replace(
             hour=0, minute=0, second=0, microsecond=0,
         )
         task = {
@@ -247,8 +249,9 @@ class TestTimezoneAwareDateComparison:
     def test_is_task_overdue_not_completed(self):
         """Test overdue task check for non-completed task"""
         # Create a task due yesterday
-        yesterday = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        yesterday = yesterday.replace(day=yesterday.day - 1)
+        yesterday = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0,
+        ) - timedelta(days=1)
 
         task = {
             "dueDate": yesterday.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
@@ -261,8 +264,9 @@ class TestTimezoneAwareDateComparison:
     def test_is_task_overdue_completed(self):
         """Test overdue task check for completed task"""
         # Create a completed task due yesterday
-        yesterday = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        yesterday = yesterday.replace(day=yesterday.day - 1)
+        yesterday = datetime.now(timezone.utc).replace(
+            hour=0, minute=0, second=0, microsecond=0,
+        ) - timedelta(days=1)
 
         task = {
             "dueDate": yesterday.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
@@ -275,7 +279,7 @@ class TestTimezoneAwareDateComparison:
     def test_is_task_overdue_due_today(self):
         """Test overdue task check for task due today"""
         # Create a task due today
-        today = datetime.utcnow()
+        today = datetime.now(timezone.utc)
 
         task = {
             "dueDate": today.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
@@ -302,22 +306,22 @@ class TestTimezoneAwareDateComparison:
     def test_timezone_consistency(self):
         """Test that timezone handling is consistent across functions"""
         # Create a task due today in Shanghai timezone
-        utc_now = datetime.utcnow()
+        utc_now = datetime.now(timezone.utc)
         task = {
             "dueDate": utc_now.strftime("%Y-%m-%dT%H:%M:%S.000+0000"),
             "status": 0,
         }
 
-        timezone = "Asia/Shanghai"
+        user_timezone = "Asia/Shanghai"
 
         # Get user's today
-        user_today = get_user_today(timezone)
+        user_today = get_user_today(user_timezone)
 
         # Check if task is due today
-        is_due_today = is_task_due_today(task, timezone)
+        is_due_today = is_task_due_today(task, user_timezone)
 
         # Check if task is overdue
-        is_overdue = is_task_overdue(task, timezone)
+        is_overdue = is_task_overdue(task, user_timezone)
 
         # If task is due today, it shouldn't be overdue
         if is_due_today:
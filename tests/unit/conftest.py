@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit test fixtures
+Shared adapter fixtures for the unit test modules
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, NonCallableMock, create_autospec
+
+import pytest
+
+import tools.projects
+import tools.tasks
+from auth import TickTickClient
+
+# Importable exactly when TickTickClient is: auth.py puts the submodule on sys.path
+if TickTickClient is None:
+    ProjectManager = TaskManager = None
+else:
+    from ticktick.managers.projects import ProjectManager
+    from ticktick.managers.tasks import TaskManager
+
+
+@contextmanager
+def _swap_attr(target, name, value):
+    """Set target.name to value, restoring the original on exit"""
+    original = getattr(target, name)
+    setattr(target, name, value)
+    try:
+        yield value
+    finally:
+        setattr(target, name, original)
+
+
+def _bind_client(adapter, client):
+    """Make adapter._ensure_client return client, restoring the original on exit"""
+    return _swap_attr(adapter, "_ensure_client", lambda: client)
+
+
+def _wire_client(client):
+    """(Re)set the instance attributes every test expects on a fresh client"""
+    client.state = {}
+    client.inbox_id = "inbox"
+    client.time_zone = ""
+    return client
+
+
+def _new_client():
+    """Stand-in for the ticktick.py client returned by _ensure_client
+
+    Autospecced against TickTickClient and its TaskManager / ProjectManager
+    when the ticktick.py submodule is available, so misspelled methods and
+    wrong call signatures fail instead of returning a new Mock. Without the
+    submodule it falls back to plain mocks; the client itself is non-magic, so
+    reset_mock() cannot clobber truthiness. The managers, state, inbox id and
+    time zone are instance attributes on the real client and are therefore
+    wired up explicitly.
+    """
+    if TickTickClient is None:
+        client = NonCallableMock()
+        client.task = MagicMock()
+        client.project = MagicMock()
+    else:
+        client = create_autospec(TickTickClient, instance=True)
+        client.task = create_autospec(TaskManager, instance=True)
+        client.project = create_autospec(ProjectManager, instance=True)
+    return _wire_client(client)
+
+
+@pytest.fixture(scope="module")
+def _module_client(adapter):
+    """Client stand-in built once per module and bound to the module adapter"""
+    client = _new_client()
+    with _bind_client(adapter, client):
+        yield client
+
+
+@pytest.fixture
+def mock_client(_module_client):
+    """The module's client stand-in, reset to a clean state for each test"""
+    _module_client.reset_mock(return_value=True, side_effect=True)
+    return _wire_client(_module_client)
+
+
+@pytest.fixture
+def adapter_with_mock(adapter, mock_client):
+    """(adapter, mock_client) pair with the client already bound"""
+    return adapter, mock_client
+
+
+@pytest.fixture
+def bind_client():
+    """Context manager binding a client to an adapter: `with bind_client(adapter, mc):`"""
+    return _bind_client
+
+
+@pytest.fixture
+def patched_tasks(mocker):
+    """Mock standing in for tools.tasks.get_client"""
+    return mocker.patch.object(tools.tasks, "get_client", new=Mock())
+
+
+@pytest.fixture
+def patched_projects(mocker):
+    """Mock standing in for tools.projects.get_client"""
+    return mocker.patch.object(tools.projects, "get_client", new=Mock())
+
+
+@pytest.fixture
+def patched_convert(mocker):
+    """Pass-through mocks standing in for the tools' UTC-to-local converters
+
+    `.task` replaces convert_task_times_to_local and `.tasks` replaces
+    convert_tasks_times_to_local, in both tools.tasks and tools.projects.
+    """
+    convert = SimpleNamespace(
+        task=Mock(side_effect=lambda task: task),
+        tasks=Mock(side_effect=lambda tasks: tasks),
+    )
+    mocker.patch.object(tools.tasks, "convert_task_times_to_local", new=convert.task)
+    mocker.patch.object(tools.tasks, "convert_tasks_times_to_local", new=convert.tasks)
+    mocker.patch.object(tools.projects, "convert_tasks_times_to_local", new=convert.tasks)
+    return convert
+
+
+@pytest.fixture(scope="session")
+def adapter_prototype():
+    """Adapter stand-in built once per worker and shared by the tool tests"""
+    return Mock()
+
+
+@pytest.fixture
+def mock_adapter(adapter_prototype, patched_tasks, patched_projects):
+    """The shared adapter stand-in, reset and returned by both tools' get_client
+
+    Resetting is used rather than copying: a shallow copy of a Mock shares its
+    child mocks, so calls and return values would leak between tests.
+    """
+    adapter_prototype.reset_mock(return_value=True, side_effect=True)
+    patched_tasks.return_value = adapter_prototype
+    patched_projects.return_value = adapter_prototype
+    return adapter_prototype
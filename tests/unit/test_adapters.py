@@ -3,469 +3,424 @@
 Adapter module comprehensive unit tests
 """
 
-import os
-import sys
-from unittest.mock import Mock, patch
+from types import MappingProxyType
+from unittest.mock import Mock, call
 
 import pytest
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
-from adapters.client import TickTickAdapter
-
-
-@pytest.mark.unit
-class TestTickTickAdapter:
-    """TickTick adapter comprehensive tests"""
-
-    def test_adapter_initialization(self):
-        """Test adapter initialization"""
-        adapter = TickTickAdapter()
-        assert adapter is not None
-        assert hasattr(adapter, "auth")
-        assert hasattr(adapter, "client")
-
-    @patch("adapters.client.TickTickAuth")
-    def test_ensure_client_success(self, mock_auth_class):
-        """Test _ensure_client method success"""
-        mock_auth = Mock()
-        mock_auth.is_authenticated.return_value = True
-        mock_client = Mock()
-        mock_auth.get_client.return_value = mock_client
-        mock_auth_class.return_value = mock_auth
-
-        adapter = TickTickAdapter()
-        result = adapter._ensure_client()
-
-        assert result == mock_client
-        mock_auth.is_authenticated.assert_called_once()
-        mock_auth.get_client.assert_called_once()
-
-    @patch("adapters.client.TickTickAuth")
-    def test_ensure_client_not_authenticated(self, mock_auth_class):
-        """Test _ensure_client when not authenticated"""
-        mock_auth = Mock()
-        mock_auth.is_authenticated.return_value = False
-        mock_auth_class.return_value = mock_auth
-
-        adapter = TickTickAdapter()
-        result = adapter._ensure_client()
-
-        assert result is None
-
-    def test_get_user_timezone_success(self):
-        """Test _get_user_timezone success"""
-        mock_client = Mock()
-        mock_client.time_zone = "Asia/Shanghai"
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter._get_user_timezone()
-            assert result == "Asia/Shanghai"
-
-    def test_get_user_timezone_no_timezone(self):
-        """Test _get_user_timezone when client has no timezone"""
-        mock_client = Mock()
-        del mock_client.time_zone  # Remove the attribute
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter._get_user_timezone()
-            assert result == ""
-
-    def test_get_user_timezone_exception(self):
-        """Test _get_user_timezone exception handling"""
-        adapter = TickTickAdapter()
-        with patch.object(
-            adapter, "_ensure_client", side_effect=Exception("Test error"),
-        ):
-            result = adapter._get_user_timezone()
-            assert result == ""
-
-
-@pytest.mark.unit
-class TestTickTickAdapterProjects:
-    """Test project-related methods"""
-
-    def test_get_projects_success(self):
-        """Test get_projects success"""
-        mock_client = Mock()
-        mock_projects = [
-            {"id": "proj1", "name": "Project 1"},
-            {"id": "proj2", "name": "Project 2"},
-        ]
-        mock_client.state = {"projects": mock_projects}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_projects()
-
-        assert result == mock_projects
-        assert len(result) == 2
-
-    def test_get_projects_empty(self):
-        """Test get_projects with empty state"""
-        mock_client = Mock()
-        mock_client.state = {}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_projects()
-
-        assert result == []
-
-    def test_get_projects_exception(self):
-        """Test get_projects exception handling"""
-        adapter = TickTickAdapter()
-        with patch.object(
-            adapter, "_ensure_client", side_effect=Exception("Test error"),
-        ):
-            result = adapter.get_projects()
-
-        assert result == []
-
-    def test_get_project_success(self):
-        """Test get_project success"""
-        mock_client = Mock()
-        mock_projects = [
-            {"id": "proj1", "name": "Project 1"},
-            {"id": "proj2", "name": "Project 2"},
-        ]
-        mock_client.state = {"projects": mock_projects}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_project("proj1")
-
-        assert result == {"id": "proj1", "name": "Project 1"}
-
-    def test_get_project_not_found(self):
-        """Test get_project when project not found"""
-        mock_client = Mock()
-        mock_client.state = {"projects": []}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_project("nonexistent")
-
-        assert result is None
-
-    def test_get_project_exception(self):
-        """Test get_project exception handling"""
-        adapter = TickTickAdapter()
-        with patch.object(
-            adapter, "_ensure_client", side_effect=Exception("Test error"),
-        ):
-            result = adapter.get_project("proj1")
-
-        assert result is None
-
-
-@pytest.mark.unit
-class TestTickTickAdapterTasks:
-    """Test task-related methods"""
-
-    def test_get_tasks_success(self):
-        """Test get_tasks success"""
-        mock_client = Mock()
-        mock_tasks = [
-            {"id": "task1", "title": "Task 1", "status": 0},
-            {"id": "task2", "title": "Task 2", "status": 2},  # completed
-        ]
-        mock_client.state = {"tasks": mock_tasks}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_tasks(include_completed=False)
-
-        # Should filter out completed tasks (status=2)
-        assert len(result) == 1
-        assert result[0]["id"] == "task1"
-
-    def test_get_tasks_include_completed(self):
-        """Test get_tasks including completed tasks"""
-        mock_client = Mock()
-        mock_tasks = [
-            {"id": "task1", "title": "Task 1", "status": 0},
-            {"id": "task2", "title": "Task 2", "status": 2},  # completed
-        ]
-        mock_client.state = {"tasks": mock_tasks}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_tasks(include_completed=True)
-
-        assert len(result) == 2
-
-    def test_create_task_success(self):
-        """Test create_task success"""
-        mock_client = Mock()
-        mock_task = {"id": "new_task", "title": "New Task"}
-        mock_client.task.builder.return_value = Mock()
-        mock_client.task.create.return_value = mock_task
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.create_task("New Task", project_id="proj1")
-
-        assert result == mock_task
-        mock_client.task.builder.assert_called_once_with("New Task")
-        mock_client.task.create.assert_called_once()
-
-    def test_create_task_without_project(self):
-        """Test create_task without project_id"""
-        mock_client = Mock()
-        mock_task = {"id": "new_task", "title": "New Task"}
-        mock_local_task = Mock()
-        mock_client.task.builder.return_value = mock_local_task
-        mock_client.task.create.return_value = mock_task
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.create_task("New Task")
-
-        assert result == mock_task
-        # Verify projectId was not added to task_data
-        mock_local_task.update.assert_called_once()
-        call_args = mock_local_task.update.call_args[0][0]
-        assert "projectId" not in call_args
-
-    def test_update_task_success(self):
-        """Test update_task success"""
-        mock_client = Mock()
-        mock_task = {"id": "task1", "title": "Updated Task"}
-        mock_client.get_by_id.return_value = mock_task
-        mock_client.task.update.return_value = mock_task
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.update_task("task1", title="Updated Task")
-
-        assert result == mock_task
-        mock_client.get_by_id.assert_called_once_with("task1")
-        mock_client.task.update.assert_called_once()
-
-    def test_update_task_not_found(self):
-        """Test update_task when task not found"""
-        mock_client = Mock()
-        mock_client.get_by_id.return_value = None
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            with pytest.raises(Exception, match="Task task1 not found"):
-                adapter.update_task("task1", title="Updated Task")
-
-    def test_delete_task_with_project_id(self):
-        """Test delete_task with project_id provided"""
-        mock_client = Mock()
-        mock_client.task.delete.return_value = True
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.delete_task("proj1", "task1")
-
-        assert result is True
-        mock_client.task.delete.assert_called_once_with("task1")
-        # Should not call get_by_id when project_id is provided
-        mock_client.get_by_id.assert_not_called()
-
-    def test_delete_task_without_project_id(self):
-        """Test delete_task without project_id"""
-        mock_client = Mock()
-        mock_task = {"id": "task1", "projectId": "proj1"}
-        mock_client.get_by_id.return_value = mock_task
-        mock_client.task.delete.return_value = True
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.delete_task("", "task1")
-
-        assert result is True
-        mock_client.get_by_id.assert_called_once_with("task1")
-        mock_client.task.delete.assert_called_once_with("task1")
-
-    def test_complete_task_success(self):
-        """Test complete_task success"""
-        mock_client = Mock()
-        mock_task = {"id": "task1", "title": "Task 1", "status": 0}
-        mock_client.get_by_id.return_value = mock_task
-        mock_client.task.complete.return_value = mock_task
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.complete_task("task1")
-
-        assert result is True
-        mock_client.get_by_id.assert_called_once_with("task1")
-        mock_client.task.complete.assert_called_once_with(mock_task)
-
-    def test_complete_task_not_found(self):
-        """Test complete_task when task not found"""
-        mock_client = Mock()
-        mock_client.get_by_id.return_value = None
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            with pytest.raises(Exception, match="Task task1 not found"):
-                adapter.complete_task("task1")
-
-    def test_complete_task_empty_dict(self):
-        """Test complete_task when get_by_id returns empty dict"""
-        mock_client = Mock()
-        mock_client.get_by_id.return_value = {}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            with pytest.raises(Exception, match="Task task1 not found"):
-                adapter.complete_task("task1")
-
-
-@pytest.mark.unit
-class TestTickTickAdapterSearch:
-    """Test search and filter methods"""
-
-    @patch("adapters.client.search_tasks_helper")
-    def test_search_tasks_success(self, mock_search_helper):
-        """Test search_tasks success"""
-        mock_client = Mock()
-        mock_all_tasks = [
-            {"id": "task1", "title": "Task 1"},
-            {"id": "task2", "title": "Task 2"},
-        ]
-        mock_filtered_tasks = [{"id": "task1", "title": "Task 1"}]
-
-        mock_client.state = {"tasks": mock_all_tasks}
-        mock_search_helper.return_value = mock_filtered_tasks
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            with patch.object(adapter, "get_tasks", return_value=mock_all_tasks):
-                result = adapter.search_tasks("Task 1")
-
-        assert result == mock_filtered_tasks
-        mock_search_helper.assert_called_once_with(mock_all_tasks, "Task 1")
-
-    def test_get_tasks_by_priority_success(self):
-        """Test get_tasks_by_priority success"""
-        mock_client = Mock()
-        mock_tasks = [
-            {"id": "task1", "title": "Task 1", "priority": 3},
-            {"id": "task2", "title": "Task 2", "priority": 1},
-            {"id": "task3", "title": "Task 3", "priority": 3},
-        ]
-        mock_client.state = {"tasks": mock_tasks}
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            result = adapter.get_tasks_by_priority(3)
-
-        assert len(result) == 2
-        assert all(task["priority"] == 3 for task in result)
-
-    @patch("adapters.client.is_task_due_today")
-    def test_get_tasks_due_today_success(self, mock_is_due_today):
-        """Test get_tasks_due_today success"""
-        mock_client = Mock()
-        mock_client.time_zone = "Asia/Shanghai"
-        mock_tasks = [
-            {"id": "task1", "title": "Task 1"},
-            {"id": "task2", "title": "Task 2"},
-        ]
-        mock_client.state = {"tasks": mock_tasks}
-
-        # Mock first task as due today, second as not
-        mock_is_due_today.side_effect = [True, False]
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            with patch.object(
-                adapter, "_get_user_timezone", return_value="Asia/Shanghai",
-            ):
-                result = adapter.get_tasks_due_today()
-
-        assert len(result) == 1
-        assert result[0]["id"] == "task1"
-
-    @patch("adapters.client.is_task_overdue")
-    def test_get_overdue_tasks_success(self, mock_is_overdue):
-        """Test get_overdue_tasks success"""
-        mock_client = Mock()
-        mock_client.time_zone = "Asia/Shanghai"
-        mock_tasks = [
-            {"id": "task1", "title": "Task 1"},
-            {"id": "task2", "title": "Task 2"},
-        ]
-        mock_client.state = {"tasks": mock_tasks}
-
-        # Mock first task as overdue, second as not
-        mock_is_overdue.side_effect = [True, False]
-
-        adapter = TickTickAdapter()
-        with patch.object(adapter, "_ensure_client", return_value=mock_client):
-            with patch.object(
-                adapter, "_get_user_timezone", return_value="Asia/Shanghai",
-            ):
-                result = adapter.get_overdue_tasks()
-
-        assert len(result) == 1
-        assert result[0]["id"] == "task1"
-
-
-@pytest.mark.unit
-class TestTickTickAdapterErrorHandling:
-    """Test error handling scenarios"""
-
-    def test_all_methods_handle_client_none(self):
-        """Test all methods handle client being None"""
-        adapter = TickTickAdapter()
-
-        with patch.object(adapter, "_ensure_client", return_value=None):
-            # These should not raise exceptions but return appropriate defaults
-            assert adapter.get_projects() == []
-            assert adapter.get_project("test") is None
-            assert adapter.get_tasks() == []
-            assert adapter.search_tasks("test") == []
-            assert adapter.get_tasks_by_priority(1) == []
-            assert adapter.get_tasks_due_today() == []
-            assert adapter.get_overdue_tasks() == []
-
-            # These should raise exceptions
-            with pytest.raises(Exception):
-                adapter.create_task("test")
-            with pytest.raises(Exception):
-                adapter.update_task("test")
-            with pytest.raises(Exception):
-                adapter.delete_task("proj", "task")
-            with pytest.raises(Exception):
-                adapter.complete_task("task")
-
-    def test_methods_handle_exceptions_gracefully(self):
-        """Test methods handle internal exceptions gracefully"""
-        adapter = TickTickAdapter()
-
-        with patch.object(
-            adapter, "_ensure_client", side_effect=Exception("Test error"),
-        ):
-            # Read methods should return empty results
-            assert adapter.get_projects() == []
-            assert adapter.get_project("test") is None
-            assert adapter.get_tasks() == []
-            assert adapter.search_tasks("test") == []
-            assert adapter.get_tasks_by_priority(1) == []
-            assert adapter.get_tasks_due_today() == []
-            assert adapter.get_overdue_tasks() == []
-
-            # Write methods should raise exceptions
-            with pytest.raises(Exception):
-                adapter.create_task("test")
-            with pytest.raises(Exception):
-                adapter.update_task("test")
-            with pytest.raises(Exception):
-                adapter.delete_task("proj", "task")
-            with pytest.raises(Exception):
-                adapter.complete_task("task")
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+from adapters.client import TaskNotFoundError, TickTickAdapter
+
+pytestmark = pytest.mark.unit
+
+# Read-only task inputs shared by the filter tests
+_TASKS_TWO = (
+    {"id": "task1", "title": "Task 1"},
+    {"id": "task2", "title": "Task 2"},
+)
+
+
+# Single open task returned by get_by_id; copy it before handing it to code that
+# mutates it (complete_task / update_task fill in projectId)
+_TASK = MappingProxyType(
+    {"id": "task1", "title": "Task 1", "projectId": "proj1", "status": 0},
+)
+
+# One open and one completed (status=2) task
+_TASKS_BASIC = (
+    {"id": "task1", "title": "Task 1", "status": 0},
+    {"id": "task2", "title": "Task 2", "status": 2},
+)
+
+
+def _client_error():
+    """Replacement for _ensure_client that fails the way a broken client would"""
+    raise RuntimeError("Test error")
+
+
+@pytest.fixture
+def tasks_basic():
+    """Fresh copies of _TASKS_BASIC for tests that hand them to the adapter"""
+    return [dict(task) for task in _TASKS_BASIC]
+
+
+# --- Adapter construction and client access ---
+
+
+def test_adapter_initialization(monkeypatch, tmp_path):
+    """Test adapter initialization"""
+    # Real TickTickAuth: keep it away from saved credentials (and the network)
+    monkeypatch.setenv("HOME", str(tmp_path))
+    adapter = TickTickAdapter()
+    assert adapter is not None
+    assert hasattr(adapter, "auth")
+    assert hasattr(adapter, "client")
+
+
+def test_ensure_client_success(monkeypatch, mock_client):
+    """Test _ensure_client method success"""
+    mock_auth = Mock()
+    mock_auth.is_authenticated.return_value = True
+    mock_auth.get_client.return_value = mock_client
+    monkeypatch.setattr("adapters.client.TickTickAuth", Mock(return_value=mock_auth))
+
+    adapter = TickTickAdapter()
+    result = adapter._ensure_client()
+
+    assert result == mock_client
+    mock_auth.is_authenticated.assert_called_once()
+    mock_auth.get_client.assert_called_once()
+
+
+def test_ensure_client_not_authenticated(monkeypatch):
+    """Test _ensure_client when not authenticated"""
+    mock_auth = Mock()
+    mock_auth.is_authenticated.return_value = False
+    monkeypatch.setattr("adapters.client.TickTickAuth", Mock(return_value=mock_auth))
+
+    adapter = TickTickAdapter()
+    result = adapter._ensure_client()
+
+    assert result is None
+
+
+def test_get_user_timezone_success(adapter_with_mock):
+    """Test _get_user_timezone success"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.time_zone = "Asia/Shanghai"
+
+    result = adapter._get_user_timezone()
+    assert result == "Asia/Shanghai"
+
+
+def test_get_user_timezone_no_timezone(adapter_with_mock):
+    """Test _get_user_timezone when client has no timezone"""
+    adapter, mock_client = adapter_with_mock
+    del mock_client.time_zone  # Remove the attribute
+
+    result = adapter._get_user_timezone()
+    assert result == ""
+
+
+def test_get_user_timezone_exception(monkeypatch, adapter):
+    """Test _get_user_timezone exception handling"""
+    monkeypatch.setattr(adapter, "_ensure_client", _client_error)
+    result = adapter._get_user_timezone()
+    assert result == ""
+
+
+# --- Projects ---
+
+
+def test_get_projects_success(adapter_with_mock):
+    """Test get_projects success"""
+    adapter, mock_client = adapter_with_mock
+    mock_projects = [
+        {"id": "proj1", "name": "Project 1"},
+        {"id": "proj2", "name": "Project 2"},
+    ]
+    mock_client.state = {"projects": mock_projects}
+
+    result = adapter.get_projects()
+
+    assert result == mock_projects
+    assert len(result) == 2
+
+
+def test_get_projects_empty(adapter_with_mock):
+    """Test get_projects with empty state"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.state = {}
+
+    result = adapter.get_projects()
+
+    assert result == []
+
+
+def test_get_projects_exception(monkeypatch, adapter):
+    """Test get_projects exception handling"""
+    monkeypatch.setattr(adapter, "_ensure_client", _client_error)
+    result = adapter.get_projects()
+
+    assert result == []
+
+
+def test_get_project_success(adapter_with_mock):
+    """Test get_project success"""
+    adapter, mock_client = adapter_with_mock
+    mock_projects = [
+        {"id": "proj1", "name": "Project 1"},
+        {"id": "proj2", "name": "Project 2"},
+    ]
+    mock_client.state = {"projects": mock_projects}
+
+    result = adapter.get_project("proj1")
+
+    assert result == {"id": "proj1", "name": "Project 1"}
+
+
+def test_get_project_not_found(adapter_with_mock):
+    """Test get_project when project not found"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.state = {"projects": []}
+
+    result = adapter.get_project("nonexistent")
+
+    assert result is None
+
+
+def test_get_project_exception(monkeypatch, adapter):
+    """Test get_project exception handling"""
+    monkeypatch.setattr(adapter, "_ensure_client", _client_error)
+    result = adapter.get_project("proj1")
+
+    assert result is None
+
+
+# --- Tasks ---
+
+
+def test_get_tasks_success(adapter_with_mock, tasks_basic):
+    """Test get_tasks success"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.state = {"tasks": tasks_basic}
+
+    result = adapter.get_tasks(include_completed=False)
+
+    # Should filter out completed tasks (status=2)
+    (only,) = result
+    assert only["id"] == "task1"
+
+
+def test_get_tasks_include_completed(adapter_with_mock, tasks_basic):
+    """Test get_tasks including completed tasks"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.state = {"tasks": tasks_basic}
+
+    result = adapter.get_tasks(include_completed=True)
+
+    assert len(result) == 2
+
+
+def test_create_task_success(adapter_with_mock):
+    """Test create_task success"""
+    adapter, mock_client = adapter_with_mock
+    mock_task = {"id": "new_task", "title": "New Task"}
+    mock_client.task.builder.return_value = Mock()
+    mock_client.task.create.return_value = mock_task
+
+    result = adapter.create_task("New Task", project_id="proj1")
+
+    assert result == mock_task
+    mock_client.task.builder.assert_called_once_with("New Task")
+    mock_client.task.create.assert_called_once()
+
+
+def test_create_task_without_project(adapter_with_mock):
+    """Test create_task without project_id"""
+    adapter, mock_client = adapter_with_mock
+    mock_task = {"id": "new_task", "title": "New Task"}
+    mock_local_task = Mock()
+    mock_client.task.builder.return_value = mock_local_task
+    mock_client.task.create.return_value = mock_task
+
+    result = adapter.create_task("New Task")
+
+    assert result == mock_task
+    # Verify projectId was not added to task_data
+    mock_local_task.update.assert_called_once()
+    call_args = mock_local_task.update.call_args[0][0]
+    assert "projectId" not in call_args
+
+
+def test_update_task_success(adapter_with_mock):
+    """Test update_task success"""
+    adapter, mock_client = adapter_with_mock
+    mock_task = {**_TASK, "title": "Updated Task"}
+    mock_client.get_by_id.return_value = mock_task
+    mock_client.task.update.return_value = mock_task
+
+    result = adapter.update_task("task1", title="Updated Task")
+
+    assert result == mock_task
+    mock_client.get_by_id.assert_called_once_with("task1")
+    mock_client.task.update.assert_called_once()
+
+
+def test_update_task_not_found(adapter_with_mock):
+    """Test update_task when task not found"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.get_by_id.return_value = None
+
+    with pytest.raises(TaskNotFoundError):
+        adapter.update_task("task1", title="Updated Task")
+
+
+# (project_id, task returned by get_by_id, whether the task is looked up first)
+DELETE_CASES = [
+    pytest.param("proj1", None, False, id="with_project_id"),
+    pytest.param("", _TASK, True, id="empty_project_id"),
+    pytest.param(None, _TASK, True, id="none_project_id"),
+    # Even if the lookup finds nothing, the delete still goes ahead
+    pytest.param("", None, True, id="task_not_found"),
+]
+
+
+@pytest.mark.parametrize(("project_id", "found_task", "expect_lookup"), DELETE_CASES)
+def test_delete_task(
+    adapter_with_mock, project_id, found_task, expect_lookup,
+):
+    """Test delete_task deletes by id, looking the task up only without a project_id"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.get_by_id.return_value = found_task
+
+    result = adapter.delete_task(project_id, "task1")
+
+    assert result is True
+    lookup = [call.get_by_id("task1")] if expect_lookup else []
+    assert mock_client.mock_calls == [*lookup, call.task.delete("task1")]
+
+
+def test_complete_task_success(adapter_with_mock):
+    """Test complete_task success"""
+    adapter, mock_client = adapter_with_mock
+    mock_task = dict(_TASK)
+    mock_client.get_by_id.return_value = mock_task
+
+    result = adapter.complete_task("task1")
+
+    assert result is True
+    mock_client.get_by_id.assert_called_once_with("task1")
+    mock_client.task.complete.assert_called_once_with(mock_task)
+
+
+@pytest.mark.parametrize(
+    "found_task", [pytest.param(None, id="none"), pytest.param({}, id="empty_dict")],
+)
+def test_complete_task_not_found(adapter_with_mock, found_task):
+    """Test complete_task when get_by_id finds no task"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.get_by_id.return_value = found_task
+
+    with pytest.raises(TaskNotFoundError):
+        adapter.complete_task("task1")
+
+
+# --- Search and filters ---
+
+
+def test_search_tasks_success(monkeypatch, adapter_with_mock):
+    """Test search_tasks success"""
+    adapter, mock_client = adapter_with_mock
+    mock_filtered_tasks = [_TASKS_TWO[0]]
+    mock_search_helper = Mock(return_value=mock_filtered_tasks)
+    monkeypatch.setattr("adapters.client.search_tasks_helper", mock_search_helper)
+
+    mock_client.state = {"tasks": _TASKS_TWO}
+
+    monkeypatch.setattr(adapter, "get_tasks", lambda include_completed=False: _TASKS_TWO)
+    result = adapter.search_tasks("Task 1")
+
+    assert result == mock_filtered_tasks
+    mock_search_helper.assert_called_once_with(_TASKS_TWO, "Task 1")
+
+
+def test_get_tasks_by_priority_success(adapter_with_mock):
+    """Test get_tasks_by_priority success"""
+    adapter, mock_client = adapter_with_mock
+    mock_tasks = [
+        {"id": "task1", "title": "Task 1", "priority": 3},
+        {"id": "task2", "title": "Task 2", "priority": 1},
+        {"id": "task3", "title": "Task 3", "priority": 3},
+    ]
+    mock_client.state = {"tasks": mock_tasks}
+
+    result = adapter.get_tasks_by_priority(3)
+
+    assert len(result) == 2
+    assert all(task["priority"] == 3 for task in result)
+
+
+def test_get_tasks_due_today_success(monkeypatch, adapter_with_mock):
+    """Test get_tasks_due_today success"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.time_zone = "Asia/Shanghai"
+    mock_client.state = {"tasks": _TASKS_TWO}
+
+    # Only task1 is due today
+    mock_is_due_today = Mock(side_effect=lambda task, tz: task["id"] == "task1")
+    monkeypatch.setattr("adapters.client.is_task_due_today", mock_is_due_today)
+
+    monkeypatch.setattr(adapter, "_get_user_timezone", lambda: "Asia/Shanghai")
+    result = adapter.get_tasks_due_today()
+
+    (only,) = result
+    assert only["id"] == "task1"
+
+
+def test_get_overdue_tasks_success(monkeypatch, adapter_with_mock):
+    """Test get_overdue_tasks success"""
+    adapter, mock_client = adapter_with_mock
+    mock_client.time_zone = "Asia/Shanghai"
+    mock_client.state = {"tasks": _TASKS_TWO}
+
+    # Only task1 is overdue
+    mock_is_overdue = Mock(side_effect=lambda task, tz: task["id"] == "task1")
+    monkeypatch.setattr("adapters.client.is_task_overdue", mock_is_overdue)
+
+    monkeypatch.setattr(adapter, "_get_user_timezone", lambda: "Asia/Shanghai")
+    result = adapter.get_overdue_tasks()
+
+    (only,) = result
+    assert only["id"] == "task1"
+
+
+# --- Error handling ---
+
+# (method name, args, default returned when the client is unavailable)
+READ_METHODS = [
+    ("get_projects", (), []),
+    ("get_project", ("test",), None),
+    ("get_tasks", (), []),
+    ("search_tasks", ("test",), []),
+    ("get_tasks_by_priority", (1,), []),
+    ("get_tasks_due_today", (), []),
+    ("get_overdue_tasks", (), []),
+]
+
+# (method name, args) for methods that must raise when the client is unavailable
+WRITE_METHODS = [
+    ("create_task", ("test",)),
+    ("update_task", ("test",)),
+    ("delete_task", ("proj", "task")),
+    ("complete_task", ("task",)),
+]
+
+
+@pytest.mark.parametrize(("name", "args", "expected"), READ_METHODS)
+def test_read_methods_handle_client_none(adapter, bind_client, name, args, expected):
+    """Test read methods return defaults when client is None"""
+    with bind_client(adapter, None):
+        assert getattr(adapter, name)(*args) == expected
+
+
+@pytest.mark.parametrize(("name", "args"), WRITE_METHODS)
+def test_write_methods_handle_client_none(adapter, bind_client, name, args):
+    """Test write methods raise when client is None"""
+    with bind_client(adapter, None):
+        with pytest.raises(Exception):
+            getattr(adapter, name)(*args)
+
+
+@pytest.mark.parametrize(("name", "args", "expected"), READ_METHODS)
+def test_read_methods_handle_exceptions_gracefully(monkeypatch, adapter, name, args, expected):
+    """Test read methods return defaults on internal exceptions"""
+    monkeypatch.setattr(adapter, "_ensure_client", _client_error)
+    assert getattr(adapter, name)(*args) == expected
+
+
+@pytest.mark.parametrize(("name", "args"), WRITE_METHODS)
+def test_write_methods_raise_on_exceptions(monkeypatch, adapter, name, args):
+    """Test write methods propagate internal exceptions"""
+    monkeypatch.setattr(adapter, "_ensure_client", _client_error)
+    with pytest.raises(Exception):
+        getattr(adapter, name)(*args)
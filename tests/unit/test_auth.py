@@ -9,6 +9,13 @@ from unittest.mock import patch
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _isolate_home(tmp_path, monkeypatch):
+    """Point HOME at an empty directory so no saved credentials are read or written"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+
+
 @pytest.mark.unit
 @pytest.mark.auth
 class TestTickTickAuth:
@@ -23,8 +30,8 @@ class TestTickTickAuth:
         """Test authentication status without environment variables"""
         with patch.dict(os.environ, {}, clear=True):
             result = auth_instance.is_authenticated()
-            # The actual behavior might be True if there are saved credentials
-            assert isinstance(result, bool)
+            # HOME is isolated, so there are no saved credentials
+            assert result is False
 
     def test_is_authenticated_with_env(self, auth_instance):
         """Test authentication status with environment variables"""
@@ -35,8 +42,8 @@ class TestTickTickAuth:
         }
         with patch.dict(os.environ, test_env, clear=True):
             result = auth_instance.is_authenticated()
-            # Should return True, but may return False due to invalid token
-            assert isinstance(result, bool)
+            # Authentication comes from saved credentials, not the environment
+            assert result is False
 
     @patch("src.auth.TickTickAuth._load_credentials")
     def test_load_credentials(self, mock_load, auth_instance):
@@ -53,6 +60,15 @@ class TestTickTickAuth:
         mock_save.assert_called_once_with(username, password)
 
 
+REQUIRED_AUTH_TOOLS = frozenset({"auth_login", "auth_logout", "auth_status"})
+
+
+@pytest.fixture(scope="module")
+def tools_by_name(auth_tool_list):
+    """Auth tool descriptors indexed by tool name"""
+    return {tool.name: tool for tool in auth_tool_list}
+
+
 @pytest.mark.unit
 @pytest.mark.auth
 class TestAuthTools:
@@ -63,36 +79,29 @@ class TestAuthTools:
         assert auth_tools is not None
         assert hasattr(auth_tools, "get_tools")
 
-    def test_get_tools(self, auth_tools):
+    def test_get_tools(self, auth_tool_list):
         """Test get tools list"""
-        tools = auth_tools.get_tools()
-        assert isinstance(tools, list)
-        assert len(tools) > 0
+        assert isinstance(auth_tool_list, list)
+        assert len(auth_tool_list) > 0
 
         # Check tool structure
-        for tool in tools:
+        for tool in auth_tool_list:
             assert hasattr(tool, "name")
             assert hasattr(tool, "description")
             assert hasattr(tool, "inputSchema")
 
-    def test_auth_login_tool(self, auth_tools):
+    def test_auth_login_tool(self, tools_by_name):
         """Test login tool"""
-        tools = auth_tools.get_tools()
-        login_tool = next((tool for tool in tools if tool.name == "auth_login"), None)
-        assert login_tool is not None
-        assert hasattr(login_tool, "inputSchema")
+        assert "auth_login" in tools_by_name
+        assert hasattr(tools_by_name["auth_login"], "inputSchema")
 
-    def test_auth_logout_tool(self, auth_tools):
+    def test_auth_logout_tool(self, tools_by_name):
         """Test logout tool"""
-        tools = auth_tools.get_tools()
-        logout_tool = next((tool for tool in tools if tool.name == "auth_logout"), None)
-        assert logout_tool is not None
+        assert "auth_logout" in tools_by_name
 
-    def test_auth_status_tool(self, auth_tools):
+    def test_auth_status_tool(self, tools_by_name):
         """Test auth status tool"""
-        tools = auth_tools.get_tools()
-        status_tool = next((tool for tool in tools if tool.name == "auth_status"), None)
-        assert status_tool is not None
+        assert "auth_status" in tools_by_name
 
 
 @pytest.mark.unit
@@ -100,19 +109,14 @@ class TestAuthTools:
 class TestAuthIntegration:
     """Auth integration test"""
 
-    @pytest.mark.asyncio
-    async def test_auth_flow(self, auth_instance, auth_tools):
+    def test_auth_flow(self, auth_instance, auth_tool_list, tools_by_name):
         """Test complete auth flow"""
         # Test authentication status check
         is_authenticated = auth_instance.is_authenticated()
         assert isinstance(is_authenticated, bool)
 
         # Test tool availability
-        tools = auth_tools.get_tools()
-        assert len(tools) >= 3  # Should have at least login, logout, status tools
+        assert len(auth_tool_list) >= 3  # Should have at least login, logout, status tools
 
         # Verify tool names
-        tool_names = [tool.name for tool in tools]
-        assert "auth_login" in tool_names
-        assert "auth_logout" in tool_names
-        assert "auth_status" in tool_names
+        assert tools_by_name.keys() >= REQUIRED_AUTH_TOOLS, REQUIRED_AUTH_TOOLS - tools_by_name.keys()
@@ -3,535 +3,339 @@
 Comprehensive tools module unit tests
 """
 
-import os
-import sys
 from datetime import datetime
-from unittest.mock import Mock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 from tools import projects, tasks
 
+pytestmark = pytest.mark.unit
+
+# Adapter return values shared by the task tool tests
+_MOCK_TASK = MappingProxyType({"id": "task1"})
+_MOCK_NEW_TASK = MappingProxyType({"id": "new_task", "title": "New Task"})
+
+# Parsed dates create_task should hand to create_task_with_dates
+_START_DATE = datetime.fromisoformat("2024-01-01")
+_DUE_DATE = datetime.fromisoformat("2024-01-02")
+
+# (tool, args, payload): list tools forward args to the same-named adapter method
+LIST_TOOL_CASES = [
+    ("get_tasks", (True,), [{"id": "task1", "title": "Task 1"}]),
+    ("search_tasks", ("test",), [{"id": "task1", "title": "Test Task"}]),
+    ("get_tasks_by_priority", (5,), [{"id": "task1", "priority": 5}]),
+    ("get_tasks_due_today", (), [{"id": "task1", "dueDate": "2024-01-01"}]),
+    ("get_overdue_tasks", (), [{"id": "task1", "dueDate": "2023-01-01"}]),
+]
+
+# (tool, args, returns_empty): read tools log and return [], write tools raise
+EXCEPTION_CASES = [
+    pytest.param(tasks.get_tasks, (), True, id="get_tasks"),
+    pytest.param(tasks.create_task, ("New Task",), False, id="create_task"),
+    pytest.param(tasks.delete_task, ("task1",), False, id="delete_task"),
+    pytest.param(tasks.complete_task, ("task1",), False, id="complete_task"),
+    pytest.param(tasks.search_tasks, ("test",), True, id="search_tasks"),
+    pytest.param(tasks.get_tasks_by_priority, (3,), True, id="get_tasks_by_priority"),
+    pytest.param(tasks.get_tasks_due_today, (), True, id="get_tasks_due_today"),
+    pytest.param(tasks.get_overdue_tasks, (), True, id="get_overdue_tasks"),
+    pytest.param(projects.get_projects, (), True, id="get_projects"),
+    pytest.param(projects.get_project, ("proj1",), False, id="get_project"),
+    pytest.param(projects.create_project, ("New Project",), False, id="create_project"),
+    pytest.param(projects.delete_project, ("proj1",), False, id="delete_project"),
+    pytest.param(projects.get_project_tasks, ("proj1",), True, id="get_project_tasks"),
+]
+
+# (tool, kwargs, adapter_method, expected, dropped): kwargs the adapter must
+# receive with these values, and ones it must not receive at all
+PARAMETER_CASES = [
+    pytest.param(
+        tasks.create_task,
+        {
+            "title": "Test Task",
+            "project_id": "proj1",
+            "content": "Test content",
+            "start_date": "2024-01-01",
+            "due_date": "2024-01-02",
+            "priority": 3,
+        },
+        "create_task_with_dates",
+        {
+            "title": "Test Task",
+            "project_id": "proj1",
+            "content": "Test content",
+            "start_date": _START_DATE,
+            "due_date": _DUE_DATE,
+            "priority": 3,
+        },
+        frozenset(),
+        id="create_with_dates",
+    ),
+    pytest.param(
+        tasks.update_task,
+        # priority 0 is a valid value and must be kept
+        {"task_id": "task1", "title": "Updated Task", "content": None, "priority": 0},
+        "update_task",
+        {"title": "Updated Task", "priority": 0},
+        frozenset({"content"}),
+        id="update_drops_none",
+    ),
+    pytest.param(
+        tasks.create_task,
+        {"title": "Test Task", "content": "", "project_id": None},
+        "create_task",
+        {"title": "Test Task", "content": ""},
+        frozenset({"projectId"}),
+        id="create_keeps_empty_string",
+    ),
+]
+
+
+def _identity(value):
+    return value
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _stub_converters():
+    """Pass task time conversion through unchanged for the whole module
+
+    Tests that assert on the conversion calls layer patched_convert on top.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(tasks, "convert_task_times_to_local", _identity)
+        mp.setattr(tasks, "convert_tasks_times_to_local", _identity)
+        mp.setattr(projects, "convert_tasks_times_to_local", _identity)
+        yield
+
+
+@pytest.fixture(scope="session")
+def long_title():
+    """A 1000-character task title, built once per worker"""
+    return "A" * 1000
+
+
+# --- Task tools ---
+
+
+@pytest.mark.parametrize(
+    ("tool", "args", "payload"), LIST_TOOL_CASES, ids=[case[0] for case in LIST_TOOL_CASES],
+)
+def test_list_tool_success(mock_adapter, patched_convert, tool, args, payload):
+    """Test list tools return the adapter's tasks after time conversion"""
+    adapter_method = getattr(mock_adapter, tool)
+    adapter_method.return_value = payload
+
+    result = getattr(tasks, tool)(*args)
+
+    assert result == payload
+    adapter_method.assert_called_once_with(*args)
+    patched_convert.tasks.assert_called_once_with(payload)
 
-@pytest.mark.unit
-class TestTaskToolsComprehensive:
-    """Comprehensive task tools tests"""
-
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_tasks_times_to_local")
-    def test_get_tasks_success(self, mock_convert, mock_get_client):
-        """Test get_tasks success path"""
-        mock_adapter = Mock()
-        mock_tasks = [{"id": "task1", "title": "Task 1"}]
-        mock_adapter.get_tasks.return_value = mock_tasks
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_tasks
-
-        result = tasks.get_tasks(include_completed=True)
-
-        assert result == mock_tasks
-        mock_adapter.get_tasks.assert_called_once_with(True)
-        mock_convert.assert_called_once_with(mock_tasks)
-
-    @patch("tools.tasks.get_client")
-    def test_get_tasks_exception(self, mock_get_client):
-        """Test get_tasks exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
-
-        result = tasks.get_tasks()
-
-        assert result == []
-
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_task_times_to_local")
-    def test_create_task_success(self, mock_convert, mock_get_client):
-        """Test create_task success path"""
-        mock_adapter = Mock()
-        mock_task = {"id": "new_task", "title": "New Task"}
-        mock_adapter.create_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_task
-
-        result = tasks.create_task("New Task", project_id="proj1", priority=3)
-
-        assert result == mock_task
-        mock_adapter.create_task.assert_called_once_with(
-            title="New Task",
-            projectId="proj1",
-            priority=3,
-        )
-        mock_convert.assert_called_once_with(mock_task)
-
-    @patch("tools.tasks.get_client")
-    def test_create_task_no_optional_params(self, mock_get_client):
-        """Test create_task with only required parameters"""
-        mock_adapter = Mock()
-        mock_task = {"id": "new_task", "title": "New Task"}
-        mock_adapter.create_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-
-        with patch("tools.tasks.convert_task_times_to_local", return_value=mock_task):
-            result = tasks.create_task("New Task")
-
-        assert result == mock_task
-        # Verify only title and priority are passed
-        mock_adapter.create_task.assert_called_once_with(
-            title="New Task",
-            priority=0,
-        )
-
-    @patch("tools.tasks.get_client")
-    def test_create_task_exception(self, mock_get_client):
-        """Test create_task exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
 
-        with pytest.raises(Exception):
-            tasks.create_task("New Task")
-
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_task_times_to_local")
-    def test_update_task_success(self, mock_convert, mock_get_client):
-        """Test update_task success path"""
-        mock_adapter = Mock()
-        mock_task = {"id": "task1", "title": "Updated Task"}
-        mock_adapter.update_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_task
-
-        result = tasks.update_task("task1", title="Updated Task", priority=5)
-
-        assert result == mock_task
-        mock_adapter.update_task.assert_called_once_with(
-            "task1",
-            None,  # project_id
-            title="Updated Task",
-            priority=5,
-        )
-
-    @patch("tools.tasks.get_client")
-    def test_update_task_no_updates(self, mock_get_client):
-        """Test update_task with no update data"""
-        mock_adapter = Mock()
-        mock_task = {"id": "task1", "title": "Task 1"}
-        mock_adapter.update_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-
-        with patch("tools.tasks.convert_task_times_to_local", return_value=mock_task):
-            result = tasks.update_task("task1")
-
-        assert result == mock_task
-        # Should still call update_task but with no additional parameters
-        mock_adapter.update_task.assert_called_once()
-
-    @patch("tools.tasks.get_client")
-    def test_delete_task_success(self, mock_get_client):
-        """Test delete_task success path"""
-        mock_adapter = Mock()
-        mock_adapter.delete_task.return_value = True
-        mock_get_client.return_value = mock_adapter
-
-        result = tasks.delete_task("task1")
-
-        assert result is True
-        mock_adapter.delete_task.assert_called_once_with(None, "task1")
-
-    @patch("tools.tasks.get_client")
-    def test_delete_task_exception(self, mock_get_client):
-        """Test delete_task exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+def test_create_task_success(mock_adapter, patched_convert):
+    """Test create_task success path"""
+    mock_adapter.create_task.return_value = _MOCK_NEW_TASK
 
-        with pytest.raises(Exception):
-            tasks.delete_task("task1")
+    result = tasks.create_task("New Task", project_id="proj1", priority=3)
 
-    @patch("tools.tasks.get_client")
-    def test_complete_task_success(self, mock_get_client):
-        """Test complete_task success path"""
-        mock_adapter = Mock()
-        mock_adapter.complete_task.return_value = True
-        mock_get_client.return_value = mock_adapter
+    assert result == _MOCK_NEW_TASK
+    mock_adapter.create_task.assert_called_once_with(
+        title="New Task",
+        projectId="proj1",
+        priority=3,
+    )
+    patched_convert.task.assert_called_once_with(_MOCK_NEW_TASK)
 
-        result = tasks.complete_task("task1")
 
-        assert result is True
-        mock_adapter.complete_task.assert_called_once_with("task1")
+def test_create_task_no_optional_params(mock_adapter):
+    """Test create_task with only required parameters"""
+    mock_adapter.create_task.return_value = _MOCK_NEW_TASK
 
-    @patch("tools.tasks.get_client")
-    def test_complete_task_exception(self, mock_get_client):
-        """Test complete_task exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+    result = tasks.create_task("New Task")
 
-        with pytest.raises(Exception):
-            tasks.complete_task("task1")
+    assert result == _MOCK_NEW_TASK
+    # Verify only title and priority are passed
+    mock_adapter.create_task.assert_called_once_with(
+        title="New Task",
+        priority=0,
+    )
 
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_tasks_times_to_local")
-    def test_search_tasks_success(self, mock_convert, mock_get_client):
-        """Test search_tasks success path"""
-        mock_adapter = Mock()
-        mock_tasks = [{"id": "task1", "title": "Test Task"}]
-        mock_adapter.search_tasks.return_value = mock_tasks
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_tasks
 
-        result = tasks.search_tasks("test")
+def test_update_task_success(mock_adapter, patched_convert):
+    """Test update_task success path"""
+    mock_adapter.update_task.return_value = _MOCK_TASK
 
-        assert result == mock_tasks
-        mock_adapter.search_tasks.assert_called_once_with("test")
+    result = tasks.update_task("task1", title="Updated Task", priority=5)
 
-    @patch("tools.tasks.get_client")
-    def test_search_tasks_exception(self, mock_get_client):
-        """Test search_tasks exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+    assert result == _MOCK_TASK
+    mock_adapter.update_task.assert_called_once_with(
+        "task1",
+        None,  # project_id
+        title="Updated Task",
+        priority=5,
+    )
 
-        result = tasks.search_tasks("test")
 
-        assert result == []
+def test_update_task_no_updates(mock_adapter):
+    """Test update_task with no update data"""
+    mock_adapter.update_task.return_value = _MOCK_TASK
 
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_tasks_times_to_local")
-    def test_get_tasks_by_priority_success(self, mock_convert, mock_get_client):
-        """Test get_tasks_by_priority success path"""
-        mock_adapter = Mock()
-        mock_tasks = [{"id": "task1", "priority": 5}]
-        mock_adapter.get_tasks_by_priority.return_value = mock_tasks
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_tasks
+    result = tasks.update_task("task1")
 
-        result = tasks.get_tasks_by_priority(5)
+    assert result == _MOCK_TASK
+    # Should still call update_task but with no additional parameters
+    mock_adapter.update_task.assert_called_once()
 
-        assert result == mock_tasks
-        mock_adapter.get_tasks_by_priority.assert_called_once_with(5)
 
-    @patch("tools.tasks.get_client")
-    def test_get_tasks_by_priority_exception(self, mock_get_client):
-        """Test get_tasks_by_priority exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+def test_delete_task_success(mock_adapter):
+    """Test delete_task success path"""
+    mock_adapter.delete_task.return_value = True
 
-        result = tasks.get_tasks_by_priority(3)
+    result = tasks.delete_task("task1")
 
-        assert result == []
+    assert result is True
+    mock_adapter.delete_task.assert_called_once_with(None, "task1")
 
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_tasks_times_to_local")
-    def test_get_tasks_due_today_success(self, mock_convert, mock_get_client):
-        """Test get_tasks_due_today success path"""
-        mock_adapter = Mock()
-        mock_tasks = [{"id": "task1", "dueDate": "2024-01-01"}]
-        mock_adapter.get_tasks_due_today.return_value = mock_tasks
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_tasks
 
-        result = tasks.get_tasks_due_today()
+def test_complete_task_success(mock_adapter):
+    """Test complete_task success path"""
+    mock_adapter.complete_task.return_value = True
 
-        assert result == mock_tasks
-        mock_adapter.get_tasks_due_today.assert_called_once()
+    result = tasks.complete_task("task1")
 
-    @patch("tools.tasks.get_client")
-    def test_get_tasks_due_today_exception(self, mock_get_client):
-        """Test get_tasks_due_today exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+    assert result is True
+    mock_adapter.complete_task.assert_called_once_with("task1")
 
-        result = tasks.get_tasks_due_today()
 
-        assert result == []
+# --- Project tools ---
 
-    @patch("tools.tasks.get_client")
-    @patch("tools.tasks.convert_tasks_times_to_local")
-    def test_get_overdue_tasks_success(self, mock_convert, mock_get_client):
-        """Test get_overdue_tasks success path"""
-        mock_adapter = Mock()
-        mock_tasks = [{"id": "task1", "dueDate": "2023-01-01"}]
-        mock_adapter.get_overdue_tasks.return_value = mock_tasks
-        mock_get_client.return_value = mock_adapter
-        mock_convert.return_value = mock_tasks
 
-        result = tasks.get_overdue_tasks()
+def test_get_projects_success(patched_projects):
+    """Test get_projects success path"""
+    mock_projects = [{"id": "proj1", "name": "Project 1"}]
+    patched_projects.return_value = SimpleNamespace(get_projects=lambda: mock_projects)
 
-        assert result == mock_tasks
-        mock_adapter.get_overdue_tasks.assert_called_once()
+    result = projects.get_projects()
 
-    @patch("tools.tasks.get_client")
-    def test_get_overdue_tasks_exception(self, mock_get_client):
-        """Test get_overdue_tasks exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+    assert result == mock_projects
 
-        result = tasks.get_overdue_tasks()
 
-        assert result == []
+def test_get_project_success(patched_projects):
+    """Test get_project success path"""
+    mock_project = {"id": "proj1", "name": "Project 1"}
+    # Any other id resolves to None, which get_project reports as not found
+    patched_projects.return_value = SimpleNamespace(get_project={"proj1": mock_project}.get)
 
+    result = projects.get_project("proj1")
 
-@pytest.mark.unit
-class TestProjectToolsComprehensive:
-    """Comprehensive project tools tests"""
+    assert result == mock_project
 
-    @patch("tools.projects.get_client")
-    def test_get_projects_success(self, mock_get_client):
-        """Test get_projects success path"""
-        mock_adapter = Mock()
-        mock_projects = [{"id": "proj1", "name": "Project 1"}]
-        mock_adapter.get_projects.return_value = mock_projects
-        mock_get_client.return_value = mock_adapter
 
-        result = projects.get_projects()
+def test_create_project_success(mock_adapter):
+    """Test create_project success path"""
+    mock_client = Mock()
+    mock_project = {"id": "new_proj", "name": "New Project"}
+    mock_client.project.create.return_value = mock_project
+    mock_adapter._ensure_client.return_value = mock_client
 
-        assert result == mock_projects
-        mock_adapter.get_projects.assert_called_once()
+    result = projects.create_project("New Project", color="blue")
 
-    @patch("tools.projects.get_client")
-    def test_get_projects_exception(self, mock_get_client):
-        """Test get_projects exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+    assert result == mock_project
+    mock_client.project.create.assert_called_once_with("New Project", "#45B7D1")
 
-        result = projects.get_projects()
 
-        assert result == []
+def test_delete_project_success(patched_projects):
+    """Test delete_project success path"""
+    client = SimpleNamespace(
+        project=SimpleNamespace(delete=lambda project_id: project_id == "proj1"),
+    )
+    patched_projects.return_value = SimpleNamespace(_ensure_client=lambda: client)
 
-    @patch("tools.projects.get_client")
-    def test_get_project_success(self, mock_get_client):
-        """Test get_project success path"""
-        mock_adapter = Mock()
-        mock_project = {"id": "proj1", "name": "Project 1"}
-        mock_adapter.get_project.return_value = mock_project
-        mock_get_client.return_value = mock_adapter
+    result = projects.delete_project("proj1")
 
-        result = projects.get_project("proj1")
+    assert result is True
 
-        assert result == mock_project
-        mock_adapter.get_project.assert_called_once_with("proj1")
 
-    @patch("tools.projects.get_client")
-    def test_get_project_exception(self, mock_get_client):
-        """Test get_project exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+def test_get_project_tasks_success(mock_adapter, patched_convert):
+    """Test get_project_tasks success path"""
+    filtered_tasks = [{"id": "task1", "projectId": "proj1", "status": 0}]
+    mock_adapter.get_project_tasks.return_value = filtered_tasks
 
-        with pytest.raises(Exception):
-            projects.get_project("proj1")
+    result = projects.get_project_tasks("proj1", include_completed=False)
+
+    assert result == filtered_tasks
+    mock_adapter.get_project_tasks.assert_called_once_with("proj1", False)
+    patched_convert.tasks.assert_called_once_with(filtered_tasks)
 
-    @patch("tools.projects.get_client")
-    def test_create_project_success(self, mock_get_client):
-        """Test create_project success path"""
-        mock_adapter = Mock()
-        mock_client = Mock()
-        mock_project = {"id": "new_proj", "name": "New Project"}
-        mock_client.project.create.return_value = mock_project
-        mock_adapter._ensure_client.return_value = mock_client
-        mock_get_client.return_value = mock_adapter
 
-        result = projects.create_project("New Project", color="blue")
+# --- Error handling ---
 
-        assert result == mock_project
-        mock_client.project.create.assert_called_once_with("New Project", "#45B7D1")
 
-    @patch("tools.projects.get_client")
-    def test_create_project_exception(self, mock_get_client):
-        """Test create_project exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+@pytest.mark.parametrize(("fn", "args", "returns_empty"), EXCEPTION_CASES)
+def test_exception_paths(patched_tasks, patched_projects, fn, args, returns_empty):
+    """Test read tools return [] and write tools raise"""
+    patched_tasks.side_effect = patched_projects.side_effect = Exception("Test error")
 
+    if returns_empty:
+        assert fn(*args) == []
+    else:
         with pytest.raises(Exception):
-            projects.create_project("New Project")
+            fn(*args)
 
-    @patch("tools.projects.get_client")
-    def test_delete_project_success(self, mock_get_client):
-        """Test delete_project success path"""
-        mock_adapter = Mock()
-        mock_client = Mock()
-        mock_client.project.delete.return_value = True
-        mock_adapter._ensure_client.return_value = mock_client
-        mock_get_client.return_value = mock_adapter
 
-        result = projects.delete_project("proj1")
+# --- Parameter filtering ---
 
-        assert result is True
-        mock_client.project.delete.assert_called_once_with("proj1")
 
-    @patch("tools.projects.get_client")
-    def test_delete_project_exception(self, mock_get_client):
-        """Test delete_project exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
+@pytest.mark.parametrize(
+    ("tool", "kwargs", "adapter_method", "expected", "dropped"), PARAMETER_CASES,
+)
+def test_parameter_filtering(mock_adapter, tool, kwargs, adapter_method, expected, dropped):
+    """Test tools forward set parameters and filter out None ones"""
+    tool(**kwargs)
 
-        with pytest.raises(Exception):
-            projects.delete_project("proj1")
-
-    @patch("tools.projects.get_client")
-    @patch("tools.projects.convert_tasks_times_to_local")
-    def test_get_project_tasks_success(self, mock_convert, mock_get_client):
-        """Test get_project_tasks success path"""
-        mock_adapter = Mock()
-        mock_client = Mock()
-        all_tasks = [
-            {"id": "task1", "projectId": "proj1", "status": 0},
-            {"id": "task2", "projectId": "proj2", "status": 0},
-            {"id": "task3", "projectId": "proj1", "status": 2},  # completed
-        ]
-        mock_client.state = {"tasks": all_tasks}
-        mock_adapter._ensure_client.return_value = mock_client
-        mock_get_client.return_value = mock_adapter
-
-        filtered_tasks = [{"id": "task1", "projectId": "proj1", "status": 0}]
-        mock_convert.return_value = filtered_tasks
-
-        result = projects.get_project_tasks("proj1", include_completed=False)
-
-        assert result == filtered_tasks
-        mock_convert.assert_called_once()
-
-    @patch("tools.projects.get_client")
-    def test_get_project_tasks_exception(self, mock_get_client):
-        """Test get_project_tasks exception handling"""
-        mock_get_client.side_effect = Exception("Test error")
-
-        result = projects.get_project_tasks("proj1")
-
-        assert result == []
-
-
-@pytest.mark.unit
-class TestToolsParameterValidation:
-    """Test parameter validation in tools"""
-
-    def test_task_creation_parameter_handling(self):
-        """Test task creation handles various parameter combinations"""
-        with patch("tools.tasks.get_client") as mock_get_client:
-            mock_adapter = Mock()
-            mock_task = {"id": "task1"}
-            mock_adapter.create_task_with_dates.return_value = mock_task
-            mock_get_client.return_value = mock_adapter
-
-            with patch(
-                "tools.tasks.convert_task_times_to_local", return_value=mock_task,
-            ):
-                # Test with all parameters
-                tasks.create_task(
-                    title="Test Task",
-                    project_id="proj1",
-                    content="Test content",
-                    start_date="2024-01-01",
-                    due_date="2024-01-02",
-                    priority=3,
-                )
-
-                # Verify the call includes all parameters
-                mock_adapter.create_task_with_dates.assert_called_once()
-                call_args = mock_adapter.create_task_with_dates.call_args[1]
-
-                assert call_args["title"] == "Test Task"
-                assert call_args["project_id"] == "proj1"
-                assert call_args["content"] == "Test content"
-                assert call_args["start_date"] == datetime.fromisoformat(
-                    "2024-01-01",
-                )
-                assert call_args["due_date"] == datetime.fromisoformat("2024-01-02")
-                assert call_args["priority"] == 3
-
-    def test_task_update_parameter_handling(self):
-        """Test task update handles parameter filtering"""
-        with patch("tools.tasks.get_client") as mock_get_client:
-            mock_adapter = Mock()
-            mock_task = {"id": "task1"}
-            mock_adapter.update_task.return_value = mock_task
-            mock_get_client.return_value = mock_adapter
-
-            with patch(
-                "tools.tasks.convert_task_times_to_local", return_value=mock_task,
-            ):
-                # Test with some None parameters (should be filtered out)
-                tasks.update_task(
-                    task_id="task1",
-                    title="Updated Task",
-                    content=None,  # Should be filtered out
-                    priority=0,  # Should be included (0 is valid)
-                )
-
-                call_args = mock_adapter.update_task.call_args[1]
-                assert "title" in call_args
-                assert "content" not in call_args  # Should be filtered out
-                assert "priority" in call_args  # 0 should be included
-
-    def test_empty_string_parameters(self):
-        """Test handling of empty string parameters"""
-        with patch("tools.tasks.get_client") as mock_get_client:
-            mock_adapter = Mock()
-            mock_task = {"id": "task1"}
-            mock_adapter.create_task.return_value = mock_task
-            mock_get_client.return_value = mock_adapter
-
-            with patch(
-                "tools.tasks.convert_task_times_to_local", return_value=mock_task,
-            ):
-                # Test with empty strings (should be included)
-                tasks.create_task(
-                    title="Test Task",
-                    content="",  # Empty string should be included
-                    project_id=None,  # None should be filtered out
-                )
-
-                call_args = mock_adapter.create_task.call_args[1]
-                # Empty string content should be included
-                if "content" in call_args:
-                    assert call_args["content"] == ""
-                # None project_id should be filtered out
-                assert "projectId" not in call_args
-
-
-@pytest.mark.unit
-class TestToolsEdgeCases:
-    """Test edge cases and boundary conditions"""
-
-    @patch("tools.tasks.get_client")
-    def test_task_priority_boundaries(self, mock_get_client):
-        """Test task priority boundary values"""
-        mock_adapter = Mock()
-        mock_task = {"id": "task1"}
-        mock_adapter.create_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-
-        with patch("tools.tasks.convert_task_times_to_local", return_value=mock_task):
-            # Test minimum priority
-            tasks.create_task("Test Task", priority=0)
-            call_args = mock_adapter.create_task.call_args[1]
-            assert call_args["priority"] == 0
-
-            # Test maximum priority
-            tasks.create_task("Test Task", priority=5)
-            call_args = mock_adapter.create_task.call_args[1]
-            assert call_args["priority"] == 5
-
-    @patch("tools.tasks.get_client")
-    def test_long_task_title(self, mock_get_client):
-        """Test handling of very long task titles"""
-        mock_adapter = Mock()
-        mock_task = {"id": "task1"}
-        mock_adapter.create_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-
-        with patch("tools.tasks.convert_task_times_to_local", return_value=mock_task):
-            long_title = "A" * 1000  # Very long title
-            tasks.create_task(long_title)
-
-            call_args = mock_adapter.create_task.call_args[1]
-            assert call_args["title"] == long_title
-
-    @patch("tools.tasks.get_client")
-    def test_special_characters_in_task_data(self, mock_get_client):
-        """Test handling of special characters in task data"""
-        mock_adapter = Mock()
-        mock_task = {"id": "task1"}
-        mock_adapter.create_task.return_value = mock_task
-        mock_get_client.return_value = mock_adapter
-
-        with patch("tools.tasks.convert_task_times_to_local", return_value=mock_task):
-            special_title = "测试任务 🎯 @#$%^&*()"
-            special_content = "Content with\nnewlines and\ttabs"
-
-            tasks.create_task(special_title, content=special_content)
-
-            call_args = mock_adapter.create_task.call_args[1]
-            assert call_args["title"] == special_title
-            assert call_args["content"] == special_content
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    method = getattr(mock_adapter, adapter_method)
+    method.assert_called_once()
+    call_kwargs = method.call_args.kwargs
+    assert {key: call_kwargs.get(key) for key in expected} == expected
+    assert not call_kwargs.keys() & dropped
+
+
+# --- Edge cases ---
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("priority", [0, 1, 3, 5])
+def test_task_priority_boundaries(mock_adapter, priority):
+    """Test every task priority level is passed through unchanged"""
+    mock_adapter.create_task.return_value = _MOCK_TASK
+
+    tasks.create_task("Test Task", priority=priority)
+
+    assert mock_adapter.create_task.call_args[1]["priority"] == priority
+
+
+@pytest.mark.slow
+def test_long_task_title(mock_adapter, long_title):
+    """Test handling of very long task titles"""
+    mock_adapter.create_task.return_value = _MOCK_TASK
+
+    tasks.create_task(long_title)
+
+    call_args = mock_adapter.create_task.call_args[1]
+    assert call_args["title"] == long_title
+
+
+@pytest.mark.slow
+def test_special_characters_in_task_data(mock_adapter):
+    """Test handling of special characters in task data"""
+    mock_adapter.create_task.return_value = _MOCK_TASK
+
+    special_title = "测试任务 🎯 @#$%^&*()"
+    special_content = "Content with\nnewlines and\ttabs"
+
+    tasks.create_task(special_title, content=special_content)
+
+    call_args = mock_adapter.create_task.call_args[1]
+    assert call_args["title"] == special_title
+    assert call_args["content"] == special_content